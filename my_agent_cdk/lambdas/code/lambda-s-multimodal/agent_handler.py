@@ -13,7 +13,8 @@ from strands_tools import image_reader, file_read
 from video_reader import video_reader
 from strands.tools import tool
 import os
-from file_utils import download_file
+import logging
+from file_utils import download_file, boto_config, base_path
 from typing import Dict, Any
 
 
@@ -21,10 +22,14 @@ from typing import Dict, Any
 region_name = os.environ["REGION_NAME"]
 model_id = os.environ["MODEL_ID"]
 
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
 # Usar la región de la variable de entorno para todos los clientes
-client_s3 = boto3.client('s3', region_name=region_name)
 session = boto3.Session(region_name=region_name)
-base_path="/tmp/"
+
+# Videos are passed to video_reader as S3 URIs instead of being downloaded
+VIDEO_EXTENSIONS = frozenset({'mp4', 'mov', 'avi', 'mkv', 'webm'})
 
 # Define a weather-focused system prompt
 MULTIMODAL_SYSTEM_PROMPT = """ You are a helpful assistant that can process documents, images, and videos. 
@@ -47,56 +52,53 @@ When displaying responses:
 Always reply in the original user language.
 """
 
+# Built once per container and reused across warm invocations (the agent itself is per request)
+bedrock_model = BedrockModel(
+    #model_id="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
+    model_id=model_id,
+    boto_session=session,
+    boto_client_config=boto_config,
+    streaming=False,
+    # Add cache checkpoints after the static system prompt and tool specs
+    cache_prompt="default",
+    cache_tools="default"
+)
+
 def handler(event: Dict[str, Any], _context) -> str:
-    print(event)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("event: %s", event)
     try: 
         prompt = event.get('prompt')
         s3object = event.get('s3object')
 
-        # Parse S3 URI
-        s3bucket = s3object.split("/")[2]
-        s3key = "/".join(s3object.split("/")[3:])
-        filename = s3object.split("/")[-1]
-        ext = filename.split(".")[-1].lower()  # Convert to lowercase for case-insensitive comparison
+        # Parse S3 URI (split by hand: '?' and '#' are valid in S3 keys)
+        s3bucket, _, s3key = s3object[5:].partition("/")
+        filename = s3key.rsplit("/", 1)[-1]
+        ext = filename.rpartition(".")[2].lower()  # Convert to lowercase for case-insensitive comparison
 
-        print("s3object: ", s3object)
-        print("bucket: ", s3bucket)
-        print("key: ", s3key)
-        print("filename: ", filename)
-        print("ext: ", ext)
-        print("region_name: ", region_name)
+        logger.debug("s3object: %s", s3object)
+        logger.debug("bucket: %s", s3bucket)
+        logger.debug("key: %s", s3key)
+        logger.debug("filename: %s", filename)
+        logger.debug("ext: %s", ext)
+        logger.debug("region_name: %s", region_name)
 
         # Check if it's a video file
-        video_extensions = ['mp4', 'mov', 'avi', 'mkv', 'webm']
-        if ext.lower() in video_extensions:
-            print("Processing video file")
+        if ext in VIDEO_EXTENSIONS:
+            logger.debug("Processing video file")
             final_prompt = f"{prompt}, file_path: {s3object}"
-            print("final_prompt: ", final_prompt)
+            logger.debug("final_prompt: %s", final_prompt)
         else:
             # For non-video files, download to /tmp directory
             path_file = base_path + filename
-            print(f"Downloading file to {path_file}")
+            logger.debug("Downloading file to %s", path_file)
             
-            # Download the file
             success = download_file(base_path, s3bucket, s3key, filename)
             if not success:
                 raise Exception(f"Failed to download file from s3://{s3bucket}/{s3key}")
-                
-            # Verify file exists after download
-            if not os.path.exists(path_file):
-                raise Exception(f"File not found at {path_file} after download")
-                
-            print(f"File downloaded successfully, size: {os.path.getsize(path_file)} bytes")
+            
             final_prompt = f"{prompt}, file_path: {path_file}"
-            print("final_prompt: ", final_prompt)
-
-
-        bedrock_model = BedrockModel(
-            #model_id="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
-            model_id=model_id,
-            boto_session=session,
-            streaming=False
-        )
+            logger.debug("final_prompt: %s", final_prompt)
 
         # Updated multimodal agent with video support
         multimodal_agent = Agent(
@@ -106,11 +108,8 @@ def handler(event: Dict[str, Any], _context) -> str:
         )
 
         result_agent = multimodal_agent(final_prompt)
-        print(result_agent)
-        return str(result_agent.message['content'][0]['text'])
+        return result_agent.message['content'][0]['text']
     
     except Exception as e:
-        import traceback
-        error_message = f"Error processing request: {str(e)}\n{traceback.format_exc()}"
-        print(error_message)
+        logger.exception("Error processing request: %s", e)
         return str(f"Error: {str(e)}")
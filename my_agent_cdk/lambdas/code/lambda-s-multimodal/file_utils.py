@@ -1,18 +1,69 @@
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import logging
 import os
+import tempfile
 
 # Usar la región de la variable de entorno para todos los clientes
 region_name = os.environ.get("REGION_NAME")
-s3_resource = boto3.resource('s3', region_name=region_name)
-client_s3 = boto3.client('s3', region_name=region_name)
+
+logger = logging.getLogger(__name__)
+
+# Local download directory, created once per container
+base_path = "/tmp/"
+os.makedirs(base_path, exist_ok=True)
+
+# Larger connection pool (ranged GETs run in parallel), keepalive and adaptive retries
+boto_config = Config(
+    region_name=region_name,
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    s3={"addressing_style": "virtual"}
+)
+
+client_s3 = boto3.client('s3', config=boto_config)
+
+# Read chunk for ranged GETs, fewer write() syscalls per MB on /tmp
+COPY_BUFFER_SIZE = 1024 * 1024
+# Write buffer for the preallocated destination file
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Parallel byte-range GETs for large multimodal payloads (videos, PDFs)
+transfer_config = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+    io_chunksize=COPY_BUFFER_SIZE,
+    max_io_queue=1000
+)
+
+# Shared HTTP session, reuses TLS connections across media requests
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # raise_on_status=False: after the last retry callers still get the error response (status_code != 200)
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+))
+
+# (connect, read) timeouts for media requests
+HTTP_TIMEOUT = (3.05, 30)
+
+# Objects already in /tmp on this (warm) container: local path -> (bucket, key, ETag)
+downloaded_objects = {}
 
 def download_file(base_path, bucket, key, filename):
     """
     Download a file from S3 to the specified local path.
     
     Args:
-        base_path: Local directory path where the file will be saved
+        base_path: Existing local directory where the file will be saved
         bucket: S3 bucket name
         key: S3 object key
         filename: Name to save the file as locally
@@ -21,66 +72,89 @@ def download_file(base_path, bucket, key, filename):
         bool: True if download was successful, False otherwise
     """
     try:
-        print(f"Downloading file from s3://{bucket}/{key} to {base_path}{filename} in region {region_name}")
-        
-        # Ensure the base path exists
-        import os
-        if not os.path.exists(base_path):
-            os.makedirs(base_path)
-            
-        # Download the file
-        with open(base_path + filename, "wb") as data:
-            client_s3.download_fileobj(bucket, key, data)
-        
-        # Verify the file was downloaded successfully
-        if os.path.exists(base_path + filename):
-            file_size = os.path.getsize(base_path + filename)
-            print(f"File downloaded successfully, size: {file_size} bytes")
+        logger.debug("Downloading file from s3://%s/%s to %s%s in region %s", bucket, key, base_path, filename, region_name)
+
+
+        # Reuse the local copy if this container already downloaded the same object version.
+        # The HEAD also gives the size to preallocate on a miss.
+        path_file = base_path + filename
+        head = client_s3.head_object(Bucket=bucket, Key=key)
+        etag = head["ETag"]
+        if downloaded_objects.get(path_file) == (bucket, key, etag) and os.path.exists(path_file):
+            logger.debug("Reusing cached file %s", path_file)
             return True
-        else:
-            print(f"File download failed: File not found at {base_path}{filename}")
-            return False
-            
+
+        # The file is overwritten below, forget what it held until the download succeeds
+        downloaded_objects.pop(path_file, None)
+
+        # Preallocate the destination so large videos don't extend the file on every write
+        fd = os.open(path_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        size = head["ContentLength"]
+        if size:
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except (AttributeError, OSError):
+                pass  # Not supported by this platform/filesystem, download anyway
+
+        # Download the file using concurrent ranged GETs into a large write buffer
+        with os.fdopen(fd, "wb", buffering=WRITE_BUFFER_SIZE) as data:
+            client_s3.download_fileobj(bucket, key, data, Config=transfer_config)
+
+        # download_fileobj raises on failure, no need to stat the file afterwards
+        logger.debug("File downloaded successfully, size: %s bytes", size)
+        downloaded_objects[path_file] = (bucket, key, etag)
+        return True
+
     except Exception as e:
-        print(f"Error downloading file from s3://{bucket}/{key}: {str(e)}")
+        logger.error("Error downloading file from s3://%s/%s: %s", bucket, key, e)
         return False
 
 def upload_data_to_s3(bytes_data,bucket_name, s3_key):
-    obj = s3_resource.Object(bucket_name, s3_key)
-    obj.put(ACL='private', Body=bytes_data)
+    client_s3.put_object(Bucket=bucket_name, Key=s3_key, Body=bytes_data, ACL='private')
     s3_url = f"https://{bucket_name}.s3.amazonaws.com/{s3_key}"
     return s3_url
 
+def _stream_to_tempfile(url, headers=None):
+    """
+    Stream an HTTP response body into a spooled temporary file.
+
+    Small bodies stay in memory, larger ones spill to disk, so the whole
+    media file is never held as a single bytes object.
+
+    Returns:
+        File object positioned at the start, or None if the request failed
+    """
+    with http_session.get(url, headers=headers, stream=True, timeout=HTTP_TIMEOUT) as response:
+        if response.status_code != 200:
+            return None
+        media = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+        for chunk in response.iter_content(chunk_size=COPY_BUFFER_SIZE):
+            media.write(chunk)
+    media.seek(0)
+    return media
+
 def download_file_from_url(url):
-    response = requests.get(url)
-    if response.status_code == 200:
-        return response.content
-    else:
-        return None
+    return _stream_to_tempfile(url)
 
 def get_media_url(mediaId,whatsToken):
     
     URL = 'https://graph.facebook.com/v17.0/'+mediaId
     headers = {'Authorization':  whatsToken}
-    print("Requesting")
-    response = requests.get(URL, headers=headers)
+    logger.debug("Requesting")
+    response = http_session.get(URL, headers=headers, timeout=HTTP_TIMEOUT)
     responsejson = response.json()
     if('url' in responsejson):
-        print("Responses: "+ str(responsejson))
+        logger.debug("Responses: %s", responsejson)
         return responsejson['url']
     else:
-        print("No URL returned")
+        logger.warning("No URL returned")
         return None
 
 def get_whats_media(url,whatsToken):
     headers = {'Authorization':  whatsToken}
-    response = requests.get(url,headers=headers)
-    if response.status_code == 200:
-        return response.content
-    else:
-        return None
+    return _stream_to_tempfile(url, headers=headers)
     
 def put_file(base_path,filename, bucket, key):
     with open(base_path+filename, "rb") as data:
         client_s3.upload_fileobj(data,bucket, key+filename)
-    print("Put file in s3://{}{}{}".format(bucket,key,filename))
+    logger.debug("Put file in s3://%s%s%s", bucket, key, filename)
@@ -1,8 +1,24 @@
 from strands import tool
 import boto3
 import os
+import logging
 from botocore.exceptions import ClientError
-from typing import Dict, Any, Optional
+from file_utils import boto_config
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Supported video extensions -> Converse API video format
+VIDEO_FORMATS = {
+    'mp4': 'mp4', 'mov': 'mov', 'avi': 'avi',
+    'mkv': 'mkv', 'webm': 'webm'
+}
+
+# Region from the Lambda environment, resolved once per container
+ENV_REGION = os.environ.get("REGION_NAME")
+
+# bedrock-runtime clients reused across invocations, keyed by region
+bedrock_clients: Dict[str, Any] = {}
 
 @tool
 def video_reader(
@@ -31,9 +47,6 @@ def video_reader(
         Dictionary with video analysis results in Converse API format
     """
     try:
-        # Always use the region from environment variable
-        env_region = os.environ.get("REGION_NAME")
-        
         # Get model_id from agent if not provided
         if not model_id and agent and hasattr(agent, 'model'):
             if hasattr(agent.model, 'model_id'):
@@ -46,17 +59,15 @@ def video_reader(
             model_id = "us.amazon.nova-pro-v1:0"  # Default fallback
             
         # Always prioritize the environment variable for region
-        if env_region:
-            region = env_region
+        if ENV_REGION:
+            region = ENV_REGION
         elif not region and agent and hasattr(agent, 'model'):
-            if hasattr(agent.model, 'boto_session') and agent.model.boto_session:
-                region = agent.model.boto_session.region_name
-            elif hasattr(agent.model, 'region'):
-                region = agent.model.region
+            boto_session = getattr(agent.model, 'boto_session', None)
+            region = boto_session.region_name if boto_session else getattr(agent.model, 'region', None)
         
         # If region is still not set, log an error
         if not region:
-            print("ERROR: No region specified and REGION_NAME environment variable not set")
+            logger.error("No region specified and REGION_NAME environment variable not set")
             return {
                 "status": "error",
                 "content": [{"text": "❌ No region specified. Please set the REGION_NAME environment variable."}]
@@ -69,12 +80,18 @@ def video_reader(
             system_prompt = "Always answer in the same language you are asked."
         
         # Initialize Bedrock client with the determined region
-        print(f"Using region: {region} for Bedrock client")
-        session = boto3.Session(region_name=region)
-        bedrock_client = session.client('bedrock-runtime')
+        logger.debug("Using region: %s for Bedrock client", region)
+        bedrock_client = bedrock_clients.get(region)
+        if bedrock_client is None:
+            bedrock_client = boto3.client('bedrock-runtime', region_name=region, config=boto_config)
+            bedrock_clients[region] = bedrock_client
+        
+        # Parse the S3 URI once, reused for the format and path checks
+        s3_parts = _parse_s3_uri(video_path)
+        filename = s3_parts[2] if s3_parts else os.path.basename(video_path)
         
         # Determine video format
-        video_format = _get_video_format(video_path)
+        video_format = _get_video_format(filename)
         if not video_format:
             return {
                 "status": "error",
@@ -82,7 +99,7 @@ def video_reader(
             }
         
         # Verify that the path is an S3 URI
-        if not video_path.startswith('s3://'):
+        if s3_parts is None:
             return {
                 "status": "error",
                 "content": [{"text": "❌ Video path must be an S3 URI (s3://bucket/path/to/video.mp4)"}]
@@ -90,7 +107,7 @@ def video_reader(
         
         # Use the S3 URI directly with Converse API
         s3_uri = video_path
-        print(f"Using S3 URI: {s3_uri} in region {region}")
+        logger.debug("Using S3 URI: %s in region %s", s3_uri, region)
         
         # Prepare message for Converse API
         media_content = {
@@ -113,7 +130,7 @@ def video_reader(
         }
         
         # Call Bedrock Converse API
-        print(f"Calling Bedrock Converse API with model {model_id} in region {region}")
+        logger.debug("Calling Bedrock Converse API with model %s in region %s", model_id, region)
         response = bedrock_client.converse(
             modelId=model_id,
             messages=[message],
@@ -142,31 +159,29 @@ def video_reader(
         
     except ClientError as e:
         error_message = f"❌ AWS Error: {e.response['Error']['Message']}"
-        print(f"ClientError: {error_message}")
+        logger.error("ClientError: %s", error_message)
         return {
             "status": "error",
             "content": [{"text": error_message}]
         }
     except Exception as e:
         error_message = f"❌ Error processing video: {str(e)}"
-        print(f"Exception: {error_message}")
+        logger.error("Exception: %s", error_message)
         return {
             "status": "error",
             "content": [{"text": error_message}]
         }
 
 
-def _get_video_format(file_path: str) -> Optional[str]:
+def _parse_s3_uri(uri: str) -> Optional[Tuple[str, str, str]]:
+    """Split an S3 URI into (bucket, key, filename), or None if it isn't one."""
+    if not uri.startswith('s3://'):
+        return None
+    bucket, _, key = uri[5:].partition('/')
+    return bucket, key, key.rsplit('/', 1)[-1]
+
+
+def _get_video_format(filename: str) -> Optional[str]:
     """Get video format from file extension."""
-    formats = {
-        '.mp4': 'mp4', '.mov': 'mov', '.avi': 'avi', 
-        '.mkv': 'mkv', '.webm': 'webm'
-    }
-    
-    if file_path.startswith('s3://'):
-        filename = file_path.split('/')[-1]
-    else:
-        filename = os.path.basename(file_path)
-    
-    _, ext = os.path.splitext(filename.lower())
-    return formats.get(ext)
+    _, dot, ext = filename.rpartition('.')
+    return VIDEO_FORMATS.get(ext.lower()) if dot else None
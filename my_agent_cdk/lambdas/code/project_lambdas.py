@@ -13,6 +13,8 @@ from constructs import Construct
 
 
 LAMBDA_TIMEOUT= 30
+# Lambda scales CPU and network bandwidth with memory, the multimodal agent downloads large files
+MULTIMODAL_MEMORY_SIZE = 3008
 
 BASE_LAMBDA_CONFIG = dict (
     timeout=Duration.seconds(LAMBDA_TIMEOUT),       
@@ -49,5 +51,5 @@ class Lambdas(Construct):
             description="A function that invokes a multimodal agent",
             handler="agent_handler.handler",
             code=aws_lambda.Code.from_asset("./lambdas/code/lambda-s-multimodal"),
-            layers=[Lay.strands_layer],**COMMON_LAMBDA_CONF
+            layers=[Lay.strands_layer],**dict(COMMON_LAMBDA_CONF, memory_size=MULTIMODAL_MEMORY_SIZE)
         )
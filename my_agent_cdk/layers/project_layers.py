@@ -23,6 +23,8 @@ class Layers(Construct):
             self, "DependenciesStrandsLayer",
             code=aws_lambda.Code.from_asset(zip_dependencies),
             compatible_runtimes=[aws_lambda.Runtime.PYTHON_3_12],
+            # Dependencies are installed with --platform manylinux2014_aarch64 --only-binary=:all:
+            compatible_architectures=[aws_lambda.Architecture.ARM_64],
             description="Dependencies needed for Strands agent Lambda"
         )
 
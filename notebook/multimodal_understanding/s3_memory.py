@@ -13,7 +13,10 @@ Features:
 
 Usage:
     from strands import Agent
-    from s3_memory import s3_vector_memory
+    from s3_memory import s3_vector_memory, warmup
+
+    # Optional, once at process start: connect and check the vector store in the background
+    warmup()
 
     agent = Agent(tools=[s3_vector_memory])
 
@@ -24,6 +27,13 @@ Usage:
         user_id="user123"
     )
 
+    # Store several memories at once (single put_vectors call)
+    agent.tool.s3_vector_memory(
+        action="store",
+        content=["User is allergic to peanuts", "User lives in Madrid"],
+        user_id="user123"
+    )
+
     # Retrieve relevant memories
     agent.tool.s3_vector_memory(
         action="retrieve",
@@ -38,33 +48,141 @@ Usage:
         user_id="user123"
     )
 
+    # Buffer memories across calls and write them with one put_vectors request
+    agent.tool.s3_vector_memory(action="store", content="User likes jazz", user_id="user123", batch=True)
+    agent.tool.s3_vector_memory(action="store", content="User works remotely", user_id="user123", batch=True)
+    agent.tool.s3_vector_memory(action="flush", user_id="user123")
+
+    # Async agents can use the non-blocking variant (aioboto3 if installed)
+    from s3_memory import s3_vector_memory_async
+    agent = Agent(tools=[s3_vector_memory_async])
+
 Environment Variables:
     VECTOR_BUCKET_NAME: S3 Vector bucket name (default: multimodal-vector-store)
     VECTOR_INDEX_NAME: Vector index name (default: strands-multimodal)
     AWS_REGION: AWS region (default: us-east-1)
     EMBEDDING_MODEL: Amazon Nova Multimodal Embeddings
         - amazon.nova-2-multimodal-embeddings-v1:0 (1024 dims, supports text/image/video/audio)
+    EMBEDDING_DIMENSION: Embedding size, one of 3072, 1024, 384, 256 (default: 1024).
+        Smaller vectors mean smaller put_vectors/query_vectors payloads; an existing
+        index keeps the dimension it was created with, so use a new VECTOR_INDEX_NAME
+    EMBEDDING_CACHE_PATH: Local SQLite cache of text embeddings
+        (default: ~/.cache/s3_memory/embeddings.db, empty string disables it)
 
 Requirements:
     - AWS credentials configured
     - Amazon S3 Vectors service access
     - Amazon Bedrock access for embeddings
     - IAM permissions for s3vectors:* and bedrock:InvokeModel
+    - Optional: aioboto3 for s3_vector_memory_async, orjson for faster embedding payload parsing
 """
 
+import asyncio
+import atexit
 import boto3
+import functools
+import hashlib
 import json
-import uuid
+import logging
+import secrets
+import sqlite3
 import os
 import time
-from typing import Dict, List
+import threading
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from botocore.exceptions import ClientError, ConnectionError as BotocoreConnectionError, HTTPClientError
+from typing import Dict, List, Union
 from datetime import datetime
 from strands import tool
 
+try:
+    import orjson
+    _json_dumps, _json_loads = orjson.dumps, orjson.loads
+except ImportError:  # optional, faster (de)serialization of embedding payloads
+    _json_dumps, _json_loads = json.dumps, json.loads
+
+try:
+    import aioboto3
+except ImportError:  # optional, s3_vector_memory_async falls back to a worker thread
+    aioboto3 = None
+
+logger = logging.getLogger(__name__)
+
+# Nova Multimodal Embeddings output sizes (EMBEDDING_DIMENSION), also the dimension of indexes created here
+EMBEDDING_DIMENSIONS = (3072, 1024, 384, 256)
+
+# Maximum number of vectors accepted by a single put_vectors request
+PUT_VECTORS_MAX_BATCH = 500
+
+# Buffered stores (batch=True) are written once this many are pending for an index,
+# by a background timer at most PUT_BUFFER_MAX_WAIT_SECONDS after the first one,
+# on action="flush", or at interpreter exit
+PUT_BUFFER_FLUSH_SIZE = 25
+PUT_BUFFER_MAX_WAIT_SECONDS = 5.0
+
+# A pending batch is written at most this many times, and only retried after throttling,
+# server-side (5xx) or connection errors; other failures drop it (logged with its keys)
+PUT_BUFFER_MAX_ATTEMPTS = 3
+_RETRYABLE_ERROR_CODES = frozenset({
+    "ThrottlingException", "TooManyRequestsException", "ServiceUnavailableException",
+    "InternalServerException", "RequestTimeout", "SlowDown"
+})
+
+# Bounded pool for concurrent embedding requests (network-bound, boto3 clients are thread-safe)
+EMBEDDING_CONCURRENCY = 8
+_EMBEDDING_EXECUTOR = ThreadPoolExecutor(max_workers=EMBEDDING_CONCURRENCY)
+
+# Standard retry mode backs off with jitter on throttling, so concurrent requests don't retry in lockstep
+_BEDROCK_CONFIG = Config(retries={"mode": "standard", "max_attempts": 5})
+
+@functools.lru_cache(maxsize=16)
+def _client(service: str, region: str):
+    """Return a boto3 client shared across tool calls (clients are thread-safe)."""
+    if service == "bedrock-runtime":
+        return boto3.client(service, region_name=region, config=_BEDROCK_CONFIG)
+    return boto3.client(service, region_name=region)
+
+# Opt-in semantic cache for retrieve results (semantic_cache=True):
+# (scope, query text digest) -> (expires_at, unit query embedding, result), in LRU order.
+# The same query text hits without an embedding request, a near-identical one after it.
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+SEMANTIC_CACHE_TTL_SECONDS = 300
+SEMANTIC_CACHE_THRESHOLD = 0.95
+_SEMANTIC_CACHE = OrderedDict()
+_SEMANTIC_CACHE_LOCK = threading.Lock()
+# Users a retrieve found no memories at all for, so any query returns empty until they store one:
+# (user_id, bucket_name, index_name) -> expires_at
+_EMPTY_USERS = {}
+
+# The list action reuses query_vectors (list_vectors has no metadata filter) with a
+# fixed query; its embedding only depends on the model: (model_id, dimension) -> embedding
+LIST_QUERY_TEXT = "user memories"
+_LIST_QUERY_EMBEDDINGS = {}
+
+# Local cache of text embeddings, so identical text is not re-embedded across runs.
+# Opened lazily; set EMBEDDING_CACHE_PATH="" to disable.
+EMBEDDING_CACHE_PATH = os.environ.get('EMBEDDING_CACHE_PATH', os.path.expanduser("~/.cache/s3_memory/embeddings.db"))
+EMBEDDING_CACHE_TTL_SECONDS = 30 * 24 * 3600
+_EMBEDDING_CACHE = None
+_EMBEDDING_CACHE_LOCK = threading.Lock()
+
+# In-process LRU in front of it (always on): cache key -> read-only embedding
+EMBEDDING_MEMORY_CACHE_MAX_ENTRIES = 4096
+_EMBEDDING_MEMORY_CACHE = OrderedDict()
+# Separate from _EMBEDDING_CACHE_LOCK so LRU hits never wait on SQLite I/O
+_EMBEDDING_MEMORY_CACHE_LOCK = threading.Lock()
+
+# (region, bucket_name, index_name) stores already known to exist, checked once per process
+_VERIFIED_STORES = set()
+_VERIFIED_STORES_LOCK = threading.Lock()
+
 @tool
 def s3_vector_memory(
     action: str,
-    content: str = None,
+    content: Union[str, List[str]] = None,
     query: str = None,
     user_id: str = None,
     vector_bucket_name: str = None,
@@ -72,7 +190,9 @@ def s3_vector_memory(
     top_k: int = 20,
     region_name: str = None,
     embedding_model: str = None,
-    min_score: float = 0.1
+    min_score: float = 0.1,
+    semantic_cache: bool = False,
+    batch: bool = False
 ) -> Dict:
     """
     AWS-native memory management using Amazon S3 Vectors.
@@ -81,10 +201,11 @@ def s3_vector_memory(
     - store: Store new memory content
     - retrieve: Search and retrieve relevant memories
     - list: List all user memories
+    - flush: Write memories buffered by store with batch=True
     
     Args:
-        action: Operation to perform (store/retrieve/list)
-        content: Content to store (required for store action)
+        action: Operation to perform (store/retrieve/list/flush)
+        content: Content to store, a string or a list of strings (required for store action)
         query: Search query (required for retrieve action)
         user_id: User identifier for memory isolation (required)
         vector_bucket_name: S3 Vector bucket (env: VECTOR_BUCKET_NAME)
@@ -93,6 +214,8 @@ def s3_vector_memory(
         region_name: AWS region (env: AWS_REGION, default: us-east-1)
         embedding_model: Bedrock embedding model (env: EMBEDDING_MODEL)
         min_score: Minimum similarity threshold (default: 0.1)
+        semantic_cache: Reuse results of a recent, near-identical retrieve query (default: False)
+        batch: Buffer stored memories and write them in a later, shared put_vectors request (default: False)
         
     Returns:
         Dict with operation results and status
@@ -102,27 +225,25 @@ def s3_vector_memory(
     if not user_id:
         return {"status": "error", "message": "user_id is required for memory isolation"}
     
+    if action == "flush":
+        return _flush_memories()
+    
     try:
         # Load configuration from environment or parameters
-        config = {
-            "bucket_name": vector_bucket_name or os.environ.get('VECTOR_BUCKET_NAME', 'multimodal-vector-store'),
-            "index_name": index_name or os.environ.get('VECTOR_INDEX_NAME', 'strands-multimodal'),
-            "region": region_name or os.environ.get('AWS_REGION', 'us-east-1'),
-            "model_id": embedding_model or os.environ.get('EMBEDDING_MODEL', 'amazon.nova-2-multimodal-embeddings-v1:0')
-        }
+        config = _load_config(vector_bucket_name, index_name, region_name, embedding_model)
         
         # Initialize AWS clients
-        bedrock = boto3.client("bedrock-runtime", region_name=config["region"])
-        s3vectors = boto3.client("s3vectors", region_name=config["region"])
+        bedrock = _client("bedrock-runtime", config["region"])
+        s3vectors = _client("s3vectors", config["region"])
         
         # Ensure vector store infrastructure exists
         _ensure_vector_store_exists(s3vectors, config)
         
         # Route to appropriate action
         if action == "store":
-            return _store_memory(s3vectors, bedrock, config, content, user_id)
+            return _store_memory(s3vectors, bedrock, config, content, user_id, batch)
         elif action == "retrieve":
-            return _retrieve_memories(s3vectors, bedrock, config, query, user_id, top_k, min_score)
+            return _retrieve_memories(s3vectors, bedrock, config, query, user_id, top_k, min_score, semantic_cache)
         elif action == "list":
             return _list_memories(s3vectors, bedrock, config, user_id, top_k)
         else:
@@ -131,27 +252,227 @@ def s3_vector_memory(
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+@tool
+async def s3_vector_memory_async(
+    action: str,
+    content: Union[str, List[str]] = None,
+    query: str = None,
+    user_id: str = None,
+    vector_bucket_name: str = None,
+    index_name: str = None,
+    top_k: int = 20,
+    region_name: str = None,
+    embedding_model: str = None,
+    min_score: float = 0.1,
+    semantic_cache: bool = False,
+    batch: bool = False
+) -> Dict:
+    """
+    AWS-native memory management using Amazon S3 Vectors, without blocking the event loop.
+    
+    Same actions and results as s3_vector_memory. Uses aioboto3 when it is
+    installed, so other tool calls of an async agent can run while embeddings
+    and vector requests are in flight; otherwise runs s3_vector_memory in a
+    worker thread.
+    
+    Actions:
+    - store: Store new memory content
+    - retrieve: Search and retrieve relevant memories
+    - list: List all user memories
+    - flush: Write memories buffered by store with batch=True
+    
+    Args:
+        action: Operation to perform (store/retrieve/list/flush)
+        content: Content to store, a string or a list of strings (required for store action)
+        query: Search query (required for retrieve action)
+        user_id: User identifier for memory isolation (required)
+        vector_bucket_name: S3 Vector bucket (env: VECTOR_BUCKET_NAME)
+        index_name: Vector index name (env: VECTOR_INDEX_NAME)
+        top_k: Maximum results to return (default: 20)
+        region_name: AWS region (env: AWS_REGION, default: us-east-1)
+        embedding_model: Bedrock embedding model (env: EMBEDDING_MODEL)
+        min_score: Minimum similarity threshold (default: 0.1)
+        semantic_cache: Reuse results of a recent, near-identical retrieve query (default: False)
+        batch: Buffer stored memories and write them in a later, shared put_vectors request (default: False)
+        
+    Returns:
+        Dict with operation results and status
+    """
+    if aioboto3 is None:
+        return await asyncio.to_thread(
+            s3_vector_memory, action=action, content=content, query=query, user_id=user_id,
+            vector_bucket_name=vector_bucket_name, index_name=index_name, top_k=top_k,
+            region_name=region_name, embedding_model=embedding_model, min_score=min_score,
+            semantic_cache=semantic_cache, batch=batch
+        )
+    
+    # Validate required user_id for security
+    if not user_id:
+        return {"status": "error", "message": "user_id is required for memory isolation"}
+    
+    # Validate input and pick the texts to embed for the action
+    if action == "store":
+        texts = _store_contents(content)
+        if not texts:
+            return {"status": "error", "message": "content is required for store action"}
+        embedding_purpose = "GENERIC_INDEX"
+    elif action == "retrieve":
+        if not query:
+            return {"status": "error", "message": "query is required for retrieve action"}
+        texts, embedding_purpose = [query], "GENERIC_RETRIEVAL"
+    elif action == "list":
+        texts, embedding_purpose = [LIST_QUERY_TEXT], "GENERIC_RETRIEVAL"
+    elif action == "flush":
+        return await asyncio.to_thread(_flush_memories)
+    else:
+        return {"status": "error", "message": f"Invalid action: {action}"}
+    
+    try:
+        config = _load_config(vector_bucket_name, index_name, region_name, embedding_model)
+        cache_scope = (user_id, config["bucket_name"], config["index_name"], top_k, min_score, config["dimension"])
+        if action == "retrieve" and semantic_cache:
+            cached = _semantic_cache_get_exact(cache_scope, query)
+            if cached is not None:
+                return dict(cached, query=query)
+        
+        list_embedding = _LIST_QUERY_EMBEDDINGS.get((config["model_id"], config["dimension"])) if action == "list" else None
+        if list_embedding is not None:
+            texts = []
+        session = aioboto3.Session()
+        async with session.client("bedrock-runtime", region_name=config["region"], config=_BEDROCK_CONFIG) as bedrock, \
+                session.client("s3vectors", region_name=config["region"]) as s3vectors:
+            # Overlap the embedding requests with the vector store existence check
+            semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+            *embeddings, _ = await asyncio.gather(
+                *(_generate_embedding_async(bedrock, config["model_id"], config["dimension"], text, embedding_purpose, semaphore) for text in texts),
+                _ensure_vector_store_exists_async(s3vectors, config)
+            )
+            
+            if action == "store":
+                vectors = _build_memory_vectors(user_id, texts, embeddings)
+                if batch:
+                    pending = await asyncio.to_thread(_PUT_BUFFER.add, config, vectors)
+                    return _buffered_store_result(content, vectors, pending)
+                for start in range(0, len(vectors), PUT_VECTORS_MAX_BATCH):
+                    await s3vectors.put_vectors(
+                        vectorBucketName=config["bucket_name"],
+                        indexName=config["index_name"],
+                        vectors=vectors[start:start + PUT_VECTORS_MAX_BATCH]
+                    )
+                _semantic_cache_invalidate(user_id)
+                return _store_result(content, vectors)
+            
+            if action == "retrieve":
+                if semantic_cache:
+                    cached = _semantic_cache_get(cache_scope, embeddings[0])
+                    if cached is not None:
+                        return dict(cached, query=query)
+                
+                response = await s3vectors.query_vectors(
+                    vectorBucketName=config["bucket_name"],
+                    indexName=config["index_name"],
+                    queryVector={"float32": embeddings[0].tolist()},
+                    topK=top_k,
+                    filter={"user_id": user_id},
+                    returnDistance=True,
+                    returnMetadata=True
+                )
+                result = _retrieve_result(response, min_score, query)
+                if semantic_cache:
+                    _semantic_cache_put(cache_scope, query, embeddings[0], result, user_empty=not response.get("vectors"))
+                return result
+            
+            if list_embedding is None:
+                list_embedding = _LIST_QUERY_EMBEDDINGS.setdefault((config["model_id"], config["dimension"]), embeddings[0])
+            response = await s3vectors.query_vectors(
+                vectorBucketName=config["bucket_name"],
+                indexName=config["index_name"],
+                queryVector={"float32": list_embedding.tolist()},
+                topK=top_k,
+                filter={"user_id": user_id},
+                returnMetadata=True
+            )
+            return _list_result(response)
+    
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+def warmup(vector_bucket_name: str = None, index_name: str = None, region_name: str = None, embedding_model: str = None):
+    """
+    Open the Bedrock and S3 Vectors connections in a background thread.
+    
+    Checks (or creates) the vector store and embeds the list query, so the first
+    tool call doesn't pay for endpoint resolution, credentials and TLS handshakes.
+    Call it once at process start, with the same configuration the tool will use.
+    """
+    config = _load_config(vector_bucket_name, index_name, region_name, embedding_model)
+    threading.Thread(target=_warmup, args=(config,), daemon=True).start()
+
+def _warmup(config):
+    """Make the first S3 Vectors and Bedrock requests for warmup(), logging failures."""
+    try:
+        _ensure_vector_store_exists(_client("s3vectors", config["region"]), config)
+        if (config["model_id"], config["dimension"]) not in _LIST_QUERY_EMBEDDINGS:
+            _LIST_QUERY_EMBEDDINGS.setdefault(
+                (config["model_id"], config["dimension"]),
+                _generate_embedding(_client("bedrock-runtime", config["region"]), config["model_id"], config["dimension"], LIST_QUERY_TEXT, embedding_purpose="GENERIC_RETRIEVAL")
+            )
+    except Exception as e:
+        logger.warning("Warmup failed: %s", e)
+
+def _load_config(vector_bucket_name, index_name, region_name, embedding_model):
+    """Resolve tool configuration from parameters or environment variables."""
+    return {
+        "bucket_name": vector_bucket_name or os.environ.get('VECTOR_BUCKET_NAME', 'multimodal-vector-store'),
+        "index_name": index_name or os.environ.get('VECTOR_INDEX_NAME', 'strands-multimodal'),
+        "region": region_name or os.environ.get('AWS_REGION', 'us-east-1'),
+        "model_id": embedding_model or os.environ.get('EMBEDDING_MODEL', 'amazon.nova-2-multimodal-embeddings-v1:0'),
+        "dimension": _embedding_dimension()
+    }
+
+def _embedding_dimension() -> int:
+    """Resolve and validate EMBEDDING_DIMENSION."""
+    value = os.environ.get('EMBEDDING_DIMENSION', '1024')
+    if not value.isdigit() or int(value) not in EMBEDDING_DIMENSIONS:
+        raise ValueError(f"EMBEDDING_DIMENSION must be one of {EMBEDDING_DIMENSIONS}, got {value!r}")
+    return int(value)
+
 def _ensure_vector_store_exists(s3vectors, config):
     """
     Ensure S3 Vector Store bucket and index exist, create if they don't.
     
+    The result is cached per process, so only the first call pays the
+    get_vector_bucket/get_index round-trips.
+    
     Args:
         s3vectors: boto3 s3vectors client
         config: Configuration dictionary with bucket_name, index_name, region
     """
+    store = (config["region"], config["bucket_name"], config["index_name"])
+    if store in _VERIFIED_STORES:
+        return
+    
+    with _VERIFIED_STORES_LOCK:
+        if store in _VERIFIED_STORES:
+            return
+        _check_or_create_vector_store(s3vectors, config)
+
+def _check_or_create_vector_store(s3vectors, config):
+    """Check the vector bucket and index, creating them if needed (uncached)."""
+    store = (config["region"], config["bucket_name"], config["index_name"])
     try:
         # Check if vector bucket exists
         try:
             s3vectors.get_vector_bucket(vectorBucketName=config["bucket_name"])
-            print(f"✅ Vector bucket '{config['bucket_name']}' already exists")
-        except Exception as e:
-            if "NotFoundException" in str(e) or "NoSuchBucket" in str(e):
+            logger.debug("Vector bucket '%s' already exists", config["bucket_name"])
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NotFoundException", "NoSuchBucket"):
                 # Create vector bucket
-                print(f"📦 Creating vector bucket '{config['bucket_name']}'...")
+                logger.info("Creating vector bucket '%s'", config["bucket_name"])
                 s3vectors.create_vector_bucket(
                     vectorBucketName=config["bucket_name"]
                 )
-                print(f"✅ Vector bucket '{config['bucket_name']}' created successfully")
+                logger.debug("Vector bucket '%s' created successfully", config["bucket_name"])
             else:
                 raise
         
@@ -161,23 +482,23 @@ def _ensure_vector_store_exists(s3vectors, config):
                 vectorBucketName=config["bucket_name"],
                 indexName=config["index_name"]
             )
-            print(f"✅ Index '{config['index_name']}' already exists")
-        except Exception as e:
-            if "NotFoundException" in str(e):
+            logger.debug("Index '%s' already exists", config["index_name"])
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NotFoundException":
                 # Create index with appropriate dimensions for embeddings
-                print(f"📊 Creating index '{config['index_name']}'...")
+                logger.info("Creating index '%s'", config["index_name"])
                 s3vectors.create_index(
                     vectorBucketName=config["bucket_name"],
                     indexName=config["index_name"],
                     dataType="float32",
-                    dimension=1024,  # Compatible with Nova and Titan (1024 dims)
+                    dimension=config["dimension"],
                     distanceMetric="cosine",
                     metadataConfiguration={
                         # Non-filterable keys: content and timestamp (we only filter by user_id)
                         "nonFilterableMetadataKeys": ["content", "timestamp"]
                     }
                 )
-                print(f"✅ Index '{config['index_name']}' created and ready!")
+                logger.debug("Index '%s' created and ready", config["index_name"])
                 
                 # Verify index was created successfully
                 try:
@@ -185,29 +506,189 @@ def _ensure_vector_store_exists(s3vectors, config):
                         vectorBucketName=config["bucket_name"],
                         indexName=config["index_name"]
                     )
-                    print(f"   Dimension: {index_info['index']['dimension']}, Metric: {index_info['index']['distanceMetric']}")
+                    logger.debug("Dimension: %s, Metric: %s", index_info["index"]["dimension"], index_info["index"]["distanceMetric"])
                 except Exception as verify_error:
-                    print(f"⚠️ Could not verify index: {str(verify_error)}")
+                    logger.warning("Could not verify index: %s", verify_error)
             else:
                 raise
+        
+        _VERIFIED_STORES.add(store)
             
     except Exception as e:
-        print(f"⚠️ Warning during vector store setup: {str(e)}")
+        logger.warning("Warning during vector store setup: %s", e)
         # Don't fail the entire operation, let it proceed and fail later if needed
 
-def _generate_embedding(bedrock, model_id: str, text: str, embedding_purpose: str = "GENERIC_INDEX") -> List[float]:
+async def _ensure_vector_store_exists_async(s3vectors, config):
+    """
+    Async counterpart of _ensure_vector_store_exists.
+    
+    Only probes the index; if it is missing, the bucket/index setup runs once
+    through the sync path in a worker thread. Known stores skip the probe.
+    
+    Args:
+        s3vectors: aioboto3 s3vectors client
+        config: Configuration dictionary with bucket_name, index_name, region
+    """
+    store = (config["region"], config["bucket_name"], config["index_name"])
+    if store in _VERIFIED_STORES:
+        return
+    
+    try:
+        await s3vectors.get_index(vectorBucketName=config["bucket_name"], indexName=config["index_name"])
+    except Exception as e:
+        if isinstance(e, ClientError) and e.response["Error"]["Code"] == "NotFoundException":
+            await asyncio.to_thread(_ensure_vector_store_exists, _client("s3vectors", config["region"]), config)
+        else:
+            # Like the sync path: don't fail the entire operation, let it proceed and fail later if needed
+            logger.warning("Warning during vector store setup: %s", e)
+        return
+    
+    _VERIFIED_STORES.add(store)
+
+def _generate_embedding(bedrock, model_id: str, dimension: int, text: str, embedding_purpose: str = "GENERIC_INDEX") -> np.ndarray:
     """
     Generate text embedding using Amazon Nova Multimodal Embeddings.
     
     Args:
         bedrock: Bedrock runtime client
         model_id: Model identifier (amazon.nova-2-multimodal-embeddings-v1:0)
+        dimension: Embedding size, one of EMBEDDING_DIMENSIONS
         text: Text to embed
         embedding_purpose: Purpose (GENERIC_INDEX for storing, GENERIC_RETRIEVAL for querying)
     
     Returns:
-        List of floats representing the embedding (1024 dimensions)
+        float32 array representing the embedding (dimension values)
     """
+    cache_key = _embedding_cache_key(model_id, dimension, embedding_purpose, text)
+    embedding = _embedding_cache_get(cache_key)
+    if embedding is not None:
+        return embedding
+    
+    response = bedrock.invoke_model(
+        modelId=model_id,
+        body=_embedding_request_body(text, dimension, embedding_purpose),
+        contentType="application/json"
+    )
+    
+    response_body = _json_loads(response["body"].read())
+    embedding = np.asarray(response_body["embeddings"][0]["embedding"], dtype=np.float32)
+    _embedding_cache_put(cache_key, embedding)
+    return embedding
+
+async def _generate_embedding_async(bedrock, model_id: str, dimension: int, text: str, embedding_purpose: str, semaphore: asyncio.Semaphore) -> np.ndarray:
+    """Async counterpart of _generate_embedding, at most EMBEDDING_CONCURRENCY requests at a time."""
+    cache_key = _embedding_cache_key(model_id, dimension, embedding_purpose, text)
+    # Only the in-process LRU is checked on the event loop, SQLite reads and writes run in a thread
+    embedding = _embedding_memory_cache_get(cache_key)
+    if embedding is None:
+        embedding = await asyncio.to_thread(_embedding_cache_get, cache_key)
+    if embedding is not None:
+        return embedding
+    
+    async with semaphore:
+        response = await bedrock.invoke_model(
+            modelId=model_id,
+            body=_embedding_request_body(text, dimension, embedding_purpose),
+            contentType="application/json"
+        )
+        response_body = _json_loads(await response["body"].read())
+    embedding = np.asarray(response_body["embeddings"][0]["embedding"], dtype=np.float32)
+    await asyncio.to_thread(_embedding_cache_put, cache_key, embedding)
+    return embedding
+
+def _embedding_cache_key(model_id: str, dimension: int, embedding_purpose: str, text: str) -> bytes:
+    """Hash identifying an embedding request in the local cache."""
+    return hashlib.sha256(f"{model_id}|{dimension}|{embedding_purpose}|{text}".encode("utf-8")).digest()
+
+def _embedding_cache():
+    """Open the local embedding cache on first use, or None if it is disabled/unavailable."""
+    global _EMBEDDING_CACHE
+    if _EMBEDDING_CACHE is None and EMBEDDING_CACHE_PATH:
+        try:
+            os.makedirs(os.path.dirname(EMBEDDING_CACHE_PATH), exist_ok=True)
+            # Short busy timeout: a cache locked by another process counts as a miss, not a wait
+            connection = sqlite3.connect(EMBEDDING_CACHE_PATH, timeout=0.5, check_same_thread=False)
+            # WAL with synchronous=NORMAL: commits don't fsync, so writes don't serialize on the disk
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key BLOB PRIMARY KEY, embedding BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            # Drop expired entries once per process
+            connection.execute("DELETE FROM embeddings WHERE created_at < ?", (time.time() - EMBEDDING_CACHE_TTL_SECONDS,))
+            connection.commit()
+            _EMBEDDING_CACHE = connection
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Embedding cache disabled: %s", e)
+            _EMBEDDING_CACHE = False
+    return _EMBEDDING_CACHE or None
+
+def _embedding_cache_get(key: bytes):
+    """Return a cached embedding (read-only, shared between callers), or None on a miss."""
+    embedding = _embedding_memory_cache_get(key)
+    if embedding is not None:
+        return embedding
+    
+    with _EMBEDDING_CACHE_LOCK:
+        connection = _embedding_cache()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute(
+                "SELECT embedding FROM embeddings WHERE key = ? AND created_at >= ?",
+                (key, time.time() - EMBEDDING_CACHE_TTL_SECONDS)
+            ).fetchone()
+        except sqlite3.Error as e:
+            # The cache is only an optimization, treat errors (locked, corrupt, ...) as a miss
+            logger.warning("Embedding cache read failed: %s", e)
+            return None
+        if row is None:
+            return None
+        embedding = np.frombuffer(row[0], dtype=np.float32)
+        _embedding_memory_cache_put(key, embedding)
+    return embedding
+
+def _embedding_memory_cache_get(key: bytes):
+    """Return an embedding from the in-process LRU only, or None."""
+    with _EMBEDDING_MEMORY_CACHE_LOCK:
+        embedding = _EMBEDDING_MEMORY_CACHE.get(key)
+        if embedding is not None:
+            _EMBEDDING_MEMORY_CACHE.move_to_end(key)
+        return embedding
+
+def _embedding_cache_put(key: bytes, embedding: np.ndarray):
+    """Store an embedding in the local cache."""
+    embedding.flags.writeable = False
+    _embedding_memory_cache_put(key, embedding)
+    with _EMBEDDING_CACHE_LOCK:
+        connection = _embedding_cache()
+        if connection is None:
+            return
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO embeddings (key, embedding, created_at) VALUES (?, ?, ?)",
+                (key, embedding.tobytes(), time.time())
+            )
+            connection.commit()
+        except sqlite3.Error as e:
+            # Skip the write (locked, disk full, read-only, ...), the embedding itself is fine
+            logger.warning("Embedding cache write failed: %s", e)
+            try:
+                connection.rollback()
+            except sqlite3.Error:
+                pass
+
+def _embedding_memory_cache_put(key: bytes, embedding: np.ndarray):
+    """Add an embedding to the in-process LRU, evicting the least recently used one."""
+    with _EMBEDDING_MEMORY_CACHE_LOCK:
+        _EMBEDDING_MEMORY_CACHE[key] = embedding
+        _EMBEDDING_MEMORY_CACHE.move_to_end(key)
+        if len(_EMBEDDING_MEMORY_CACHE) > EMBEDDING_MEMORY_CACHE_MAX_ENTRIES:
+            _EMBEDDING_MEMORY_CACHE.popitem(last=False)
+
+def _embedding_request_body(text: str, dimension: int, embedding_purpose: str) -> Union[str, bytes]:
+    """Build the Amazon Nova Multimodal Embeddings request body for a text."""
     # Truncate text if exceeds model limit (8K tokens)
     if len(text) > 8000:
         text = text[:8000]
@@ -217,125 +698,422 @@ def _generate_embedding(bedrock, model_id: str, text: str, embedding_purpose: st
         "taskType": "SINGLE_EMBEDDING",
         "singleEmbeddingParams": {
             "embeddingPurpose": embedding_purpose,
-            "embeddingDimension": 1024,  # 1024 dims for optimal performance
+            "embeddingDimension": dimension,
             "text": {"truncationMode": "END", "value": text}
         }
     }
+    return _json_dumps(request_body)
+
+def _generate_embeddings_batch(bedrock, model_id: str, dimension: int, texts: List[str], embedding_purpose: str = "GENERIC_INDEX") -> List[np.ndarray]:
+    """
+    Generate embeddings for several texts.
     
-    response = bedrock.invoke_model(
-        modelId=model_id,
-        body=json.dumps(request_body),
-        contentType="application/json"
-    )
+    Nova Multimodal Embeddings has no synchronous multi-input request, so each
+    text is embedded with its own SINGLE_EMBEDDING call; the calls run
+    concurrently on a bounded thread pool.
     
-    response_body = json.loads(response["body"].read())
-    return response_body["embeddings"][0]["embedding"]
+    Args:
+        bedrock: Bedrock runtime client
+        model_id: Model identifier (amazon.nova-2-multimodal-embeddings-v1:0)
+        dimension: Embedding size, one of EMBEDDING_DIMENSIONS
+        texts: Texts to embed
+        embedding_purpose: Purpose (GENERIC_INDEX for storing, GENERIC_RETRIEVAL for querying)
+    
+    Returns:
+        One embedding per text, in input order
+    """
+    if len(texts) == 1:
+        return [_generate_embedding(bedrock, model_id, dimension, texts[0], embedding_purpose)]
+    
+    return list(_EMBEDDING_EXECUTOR.map(
+        lambda text: _generate_embedding(bedrock, model_id, dimension, text, embedding_purpose),
+        texts
+    ))
 
-def _store_memory(s3vectors, bedrock, config, content, user_id):
-    """Store memory with user isolation."""
-    if not content:
+def _store_memory(s3vectors, bedrock, config, content, user_id, batch=False):
+    """Store one or several memories with user isolation, or buffer them when batch is set."""
+    contents = _store_contents(content)
+    if not contents:
         return {"status": "error", "message": "content is required for store action"}
     
-    # Generate embedding for indexing
-    embedding = _generate_embedding(bedrock, config["model_id"], content, embedding_purpose="GENERIC_INDEX")
+    # Generate embeddings for indexing
+    embeddings = _generate_embeddings_batch(bedrock, config["model_id"], config["dimension"], contents, embedding_purpose="GENERIC_INDEX")
+    vectors = _build_memory_vectors(user_id, contents, embeddings)
     
-    # Create unique memory key with user prefix
-    memory_key = f"{user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    if batch:
+        pending = _PUT_BUFFER.add(config, vectors)
+        return _buffered_store_result(content, vectors, pending)
     
-    # Prepare vector data with metadata
-    vector_data = {
-        "key": memory_key,
-        "data": {"float32": [float(x) for x in embedding]},
-        "metadata": {
-            "user_id": user_id,
-            "content": content,
-            "timestamp": datetime.now().isoformat()
-        }
+    _put_vectors(s3vectors, config["bucket_name"], config["index_name"], vectors)
+    _semantic_cache_invalidate(user_id)
+    return _store_result(content, vectors)
+
+def _store_contents(content) -> List[str]:
+    """Texts to store for a store action's content, or an empty list if any is missing."""
+    contents = [content] if isinstance(content, str) else list(content or [])
+    return contents if all(contents) else []
+
+def _put_vectors(s3vectors, bucket_name, index_name, vectors):
+    """Store vectors in S3 Vectors, one request per PUT_VECTORS_MAX_BATCH vectors."""
+    for start in range(0, len(vectors), PUT_VECTORS_MAX_BATCH):
+        s3vectors.put_vectors(
+            vectorBucketName=bucket_name,
+            indexName=index_name,
+            vectors=vectors[start:start + PUT_VECTORS_MAX_BATCH]
+        )
+
+class _PutBuffer:
+    """Pending put_vectors entries per vector index, written with as few requests as possible."""
+    
+    def __init__(self, flush_size: int = PUT_BUFFER_FLUSH_SIZE, max_wait: float = PUT_BUFFER_MAX_WAIT_SECONDS):
+        self.flush_size = flush_size
+        self.max_wait = max_wait
+        # (region, bucket_name, index_name) -> pending vectors
+        self._pending = {}
+        # (region, bucket_name, index_name) -> failed writes of the pending vectors so far
+        self._attempts = {}
+        # (region, bucket_name, index_name) -> the timer that will flush it, at most one per index
+        self._timers = {}
+        # Set by the exit flush, after which no timers are started
+        self._closing = False
+        self._lock = threading.Lock()
+    
+    def add(self, config, vectors) -> int:
+        """Queue vectors for the config's index, writing them once flush_size are pending or max_wait passed.
+        
+        Returns:
+            Number of vectors still pending for the index
+        """
+        store = (config["region"], config["bucket_name"], config["index_name"])
+        with self._lock:
+            # Bound how long the pending vectors wait (no-op if a timer is already running)
+            self._schedule_flush(store)
+            pending = self._pending.setdefault(store, [])
+            pending.extend(vectors)
+            if len(pending) < self.flush_size:
+                return len(pending)
+            del self._pending[store]
+        try:
+            self._put(store, pending)
+        except Exception as e:
+            if not self._retry_later(store, pending, e):
+                raise
+            # The vectors are buffered again and will still be written, so the store itself succeeded
+            logger.warning("Flush of buffered memories failed, will retry: %s", e)
+            with self._lock:
+                return len(self._pending.get(store, ()))
+        return 0
+    
+    def flush(self) -> int:
+        """Write all pending vectors and return how many were written."""
+        with self._lock:
+            stores = list(self._pending)
+        
+        return sum(self._flush_store(store) for store in stores)
+    
+    def _flush_store(self, store) -> int:
+        with self._lock:
+            vectors = self._pending.pop(store, None)
+        if not vectors:
+            return 0
+        try:
+            self._put(store, vectors)
+        except Exception as e:
+            self._retry_later(store, vectors, e)
+            raise
+        return len(vectors)
+    
+    def flush_at_exit(self) -> int:
+        """Write all pending vectors without scheduling retries, for interpreter exit."""
+        with self._lock:
+            self._closing = True
+        return self.flush()
+    
+    def _schedule_flush(self, store):
+        # Called with _lock held
+        if self._closing or store in self._timers:
+            return
+        timer = threading.Timer(self.max_wait, self._flush_in_background, args=(store,))
+        timer.daemon = True
+        self._timers[store] = timer
+        timer.start()
+    
+    def _flush_in_background(self, store):
+        with self._lock:
+            self._timers.pop(store, None)
+        try:
+            self._flush_store(store)
+        except Exception as e:
+            # Retryable failures stay buffered for the next flush, others were dropped and logged
+            logger.warning("Background flush of buffered memories failed: %s", e)
+    
+    def _put(self, store, vectors):
+        region, bucket_name, index_name = store
+        _put_vectors(_client("s3vectors", region), bucket_name, index_name, vectors)
+        with self._lock:
+            self._attempts.pop(store, None)
+        
+        for user_id in {vector["metadata"]["user_id"] for vector in vectors}:
+            _semantic_cache_invalidate(user_id)
+
+    def _retry_later(self, store, vectors, error) -> bool:
+        """Buffer vectors whose write failed again, or drop them; returns whether they will be retried."""
+        with self._lock:
+            attempts = self._attempts.get(store, 0) + 1
+            # Nothing retries once the exit flush has started
+            if not self._closing and _is_retryable(error) and attempts < PUT_BUFFER_MAX_ATTEMPTS:
+                # Keep them (ahead of newer ones) and retry within max_wait
+                self._attempts[store] = attempts
+                self._pending.setdefault(store, [])[:0] = vectors
+                self._schedule_flush(store)
+                return True
+            self._attempts.pop(store, None)
+        
+        logger.error(
+            "Dropping %d buffered memories for %s/%s after %d failed write(s): %s (keys: %s)",
+            len(vectors), store[1], store[2], attempts, error, [vector["key"] for vector in vectors]
+        )
+        return False
+
+def _is_retryable(error) -> bool:
+    """Whether a failed request may succeed later: throttling, server-side or connection errors."""
+    if isinstance(error, ClientError):
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return error.response["Error"].get("Code") in _RETRYABLE_ERROR_CODES or status >= 500
+    return isinstance(error, (BotocoreConnectionError, HTTPClientError))
+
+_PUT_BUFFER = _PutBuffer()
+atexit.register(_PUT_BUFFER.flush_at_exit)
+
+def _flush_memories():
+    """Write all buffered memories and build the flush action result."""
+    try:
+        written = _PUT_BUFFER.flush()
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+    
+    return {
+        "status": "success",
+        "message": f"{written} buffered memories stored successfully",
+        "stored": written
     }
+
+def _build_memory_vectors(user_id, contents, embeddings):
+    """Build put_vectors entries for memories with their embeddings."""
+    # One clock read per store call, shared by keys and metadata
+    now = datetime.now()
+    key_prefix = f"{user_id}_{now.strftime('%Y%m%d_%H%M%S')}_"
+    timestamp = now.isoformat()
     
-    # Store in S3 Vectors
-    s3vectors.put_vectors(
-        vectorBucketName=config["bucket_name"],
-        indexName=config["index_name"],
-        vectors=[vector_data]
-    )
+    vectors = []
+    for text, embedding in zip(contents, embeddings):
+        # Create unique memory key with user prefix
+        memory_key = key_prefix + secrets.token_hex(4)
+        
+        # Prepare vector data with metadata
+        vectors.append({
+            "key": memory_key,
+            "data": {"float32": embedding.tolist()},
+            "metadata": {
+                "user_id": user_id,
+                "content": text,
+                "timestamp": timestamp
+            }
+        })
+    return vectors
+
+def _store_result(content, vectors):
+    """Build the store action result, a single key when content was a string."""
+    if isinstance(content, str):
+        return {
+            "status": "success", 
+            "message": "Memory stored successfully", 
+            "memory_key": vectors[0]["key"]
+        }
     
     return {
-        "status": "success", 
-        "message": "Memory stored successfully", 
-        "memory_key": memory_key
+        "status": "success",
+        "message": f"{len(vectors)} memories stored successfully",
+        "memory_keys": [vector["key"] for vector in vectors]
     }
 
-def _retrieve_memories(s3vectors, bedrock, config, query, user_id, top_k, min_score):
+def _buffered_store_result(content, vectors, pending):
+    """Build the store action result for memories queued in the put buffer."""
+    result = _store_result(content, vectors)
+    result["message"] = "Memory buffered" if isinstance(content, str) else f"{len(vectors)} memories buffered"
+    result["pending"] = pending
+    return result
+
+def _retrieve_memories(s3vectors, bedrock, config, query, user_id, top_k, min_score, semantic_cache=False):
     """Retrieve relevant memories for user."""
     if not query:
         return {"status": "error", "message": "query is required for retrieve action"}
     
+    # Same or near-identical recent query for the same user and search parameters skips the vector search
+    cache_scope = (user_id, config["bucket_name"], config["index_name"], top_k, min_score, config["dimension"])
+    if semantic_cache:
+        cached = _semantic_cache_get_exact(cache_scope, query)
+        if cached is not None:
+            return dict(cached, query=query)
+    
     # Generate query embedding for retrieval
-    query_embedding = _generate_embedding(bedrock, config["model_id"], query, embedding_purpose="GENERIC_RETRIEVAL")
+    query_embedding = _generate_embedding(bedrock, config["model_id"], config["dimension"], query, embedding_purpose="GENERIC_RETRIEVAL")
+    if semantic_cache:
+        cached = _semantic_cache_get(cache_scope, query_embedding)
+        if cached is not None:
+            return dict(cached, query=query)
     
-    # Search with user filter for isolation
+    # Search with user filter for isolation. Metadata only holds user_id, content and
+    # timestamp (see _build_memory_vectors), so returnMetadata carries no unused keys.
     response = s3vectors.query_vectors(
         vectorBucketName=config["bucket_name"],
         indexName=config["index_name"],
-        queryVector={"float32": query_embedding},
+        queryVector={"float32": query_embedding.tolist()},
         topK=top_k,
         filter={"user_id": user_id},
         returnDistance=True,
         returnMetadata=True
     )
     
-    # Process results
-    memories = []
-    for vector in response.get("vectors", []):
-        # Verify user isolation
-        if vector["metadata"].get("user_id") != user_id:
-            continue
-            
-        # Calculate similarity score
-        similarity = 1.0 - vector.get("distance", 1.0)
-        
-        # Filter by minimum score
-        if similarity >= min_score:
-            memories.append({
-                "id": vector["key"],
-                "memory": vector["metadata"].get("content", ""),
-                "similarity": round(similarity, 3),
-                "created_at": vector["metadata"].get("timestamp", "")
-            })
-    
-    # Sort by similarity
-    memories.sort(key=lambda x: x["similarity"], reverse=True)
+    result = _retrieve_result(response, min_score, query)
+    if semantic_cache:
+        _semantic_cache_put(cache_scope, query, query_embedding, result, user_empty=not response.get("vectors"))
+    return result
+
+def _retrieve_result(response, min_score, query):
+    """Build the retrieve action result from a query_vectors response."""
+    # User isolation is enforced by the query filter (filter={"user_id": ...})
+    memories = _rank_vectors(response.get("vectors", []), min_score)
     
     return {
         "status": "success",
-        "memories": memories[:top_k],
+        "memories": memories,
         "total_found": len(memories),
         "query": query
     }
 
+def _rank_vectors(vectors, min_score):
+    """Turn query_vectors results into memories at or above min_score, in the order returned."""
+    # query_vectors already returns results by ascending distance, so filtering keeps them
+    # most similar first; dicts are only built for the memories returned
+    similarities = 1.0 - np.fromiter(
+        (vector.get("distance", 1.0) for vector in vectors), dtype=np.float64, count=len(vectors)
+    )
+    keep = np.flatnonzero(similarities >= min_score)
+    
+    memories = []
+    for i in keep.tolist():
+        metadata = vectors[i]["metadata"]
+        memories.append({
+            "id": vectors[i]["key"],
+            "memory": metadata.get("content", ""),
+            "similarity": round(float(similarities[i]), 3),
+            "created_at": metadata.get("timestamp", "")
+        })
+    return memories
+
+def _semantic_cache_get_exact(scope, query):
+    """Return a cached, unexpired retrieve result for the same query text (or a user without memories), or None."""
+    key = (scope, hashlib.sha1(query.encode("utf-8")).digest())
+    with _SEMANTIC_CACHE_LOCK:
+        expires_at = _EMPTY_USERS.get(scope[:3])
+        if expires_at is not None:
+            if expires_at > time.monotonic():
+                return {"status": "success", "memories": [], "total_found": 0}
+            del _EMPTY_USERS[scope[:3]]
+        
+        entry = _SEMANTIC_CACHE.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _SEMANTIC_CACHE[key]
+            return None
+        _SEMANTIC_CACHE.move_to_end(key)
+        return entry[2]
+
+def _semantic_cache_get(scope, embedding):
+    """
+    Return a cached retrieve result whose query embedding is close enough to this one.
+    
+    Args:
+        scope: (user_id, bucket_name, index_name, top_k, min_score, dimension) the result was computed for
+        embedding: Query embedding
+    
+    Returns:
+        Cached result dict, or None on a miss
+    """
+    query = _unit_vector(embedding)
+    now = time.monotonic()
+    with _SEMANTIC_CACHE_LOCK:
+        for key in [key for key, entry in _SEMANTIC_CACHE.items() if entry[0] <= now]:
+            del _SEMANTIC_CACHE[key]
+        
+        candidates = [(key, entry) for key, entry in _SEMANTIC_CACHE.items() if key[0] == scope]
+        if not candidates:
+            return None
+        
+        similarities = np.stack([entry[1] for _, entry in candidates]) @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < SEMANTIC_CACHE_THRESHOLD:
+            return None
+        
+        key, entry = candidates[best]
+        _SEMANTIC_CACHE.move_to_end(key)
+        return entry[2]
+
+def _semantic_cache_put(scope, query, embedding, result, user_empty=False):
+    """Cache a retrieve result for its query, evicting the least recently used entry."""
+    unit = _unit_vector(embedding)
+    key = (scope, hashlib.sha1(query.encode("utf-8")).digest())
+    with _SEMANTIC_CACHE_LOCK:
+        if user_empty:
+            _EMPTY_USERS[scope[:3]] = time.monotonic() + SEMANTIC_CACHE_TTL_SECONDS
+        _SEMANTIC_CACHE[key] = (time.monotonic() + SEMANTIC_CACHE_TTL_SECONDS, unit, result)
+        _SEMANTIC_CACHE.move_to_end(key)
+        while len(_SEMANTIC_CACHE) > SEMANTIC_CACHE_MAX_ENTRIES:
+            _SEMANTIC_CACHE.popitem(last=False)
+
+def _semantic_cache_invalidate(user_id):
+    """Drop cached retrieve results for a user whose memories changed."""
+    with _SEMANTIC_CACHE_LOCK:
+        for key in [key for key in _EMPTY_USERS if key[0] == user_id]:
+            del _EMPTY_USERS[key]
+        for key in [key for key in _SEMANTIC_CACHE if key[0][0] == user_id]:
+            del _SEMANTIC_CACHE[key]
+
+def _unit_vector(embedding):
+    """L2-normalize an embedding so cosine similarity is a dot product."""
+    vector = np.asarray(embedding, dtype=np.float32)  # no copy for float32 arrays
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
 def _list_memories(s3vectors, bedrock, config, user_id, top_k):
     """List all user memories."""
-    # Use generic embedding for listing
-    generic_embedding = _generate_embedding(bedrock, config["model_id"], "user memories", embedding_purpose="GENERIC_RETRIEVAL")
+    # Use generic embedding for listing, computed once per model and dimension
+    generic_embedding = _LIST_QUERY_EMBEDDINGS.get((config["model_id"], config["dimension"]))
+    if generic_embedding is None:
+        generic_embedding = _LIST_QUERY_EMBEDDINGS.setdefault(
+            (config["model_id"], config["dimension"]),
+            _generate_embedding(bedrock, config["model_id"], config["dimension"], LIST_QUERY_TEXT, embedding_purpose="GENERIC_RETRIEVAL")
+        )
     
     # Query all user vectors
     response = s3vectors.query_vectors(
         vectorBucketName=config["bucket_name"],
         indexName=config["index_name"],
-        queryVector={"float32": generic_embedding},
+        queryVector={"float32": generic_embedding.tolist()},
         topK=top_k,
         filter={"user_id": user_id},
         returnMetadata=True
     )
     
-    # Process memories
+    return _list_result(response)
+
+def _list_result(response):
+    """Build the list action result from a query_vectors response."""
+    # Process memories, user isolation is enforced by the query filter (filter={"user_id": ...})
     memories = []
     for vector in response.get("vectors", []):
-        # Verify user isolation
-        if vector["metadata"].get("user_id") != user_id:
-            continue
-            
         memories.append({
             "id": vector["key"],
             "memory": vector["metadata"].get("content", ""),
@@ -1,12 +1,59 @@
 """
 Video Reader Tool for Strands Agents
 """
+import asyncio
 import boto3
+import functools
+import hashlib
 import os
+import re
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing import Dict, Any, Optional
 from strands import tool
 
+# Shared by all clients: keep connections open between calls and back off on throttling
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
+# Multipart uploads in parallel 8 MiB parts, for videos of hundreds of MB
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+_CONTENT_TYPES = {
+    'mp4': 'video/mp4', 'mov': 'video/quicktime', 'avi': 'video/x-msvideo',
+    'mkv': 'video/x-matroska', 'webm': 'video/webm'
+}
+
+# Supported video extensions -> Converse API format
+_VIDEO_FORMATS = {
+    '.mp4': 'mp4', '.mov': 'mov', '.avi': 'avi',
+    '.mkv': 'mkv', '.webm': 'webm'
+}
+
+# Requests Nova cannot fulfil (identifying people), matched case-insensitively in one pass
+_FORBIDDEN_PROMPT_RE = re.compile(r"identify|who is", re.IGNORECASE)
+
+# (region, bucket) pairs known to exist, so later uploads skip the head_bucket check
+_VERIFIED_BUCKETS = set()
+
+# (region, model_id) pairs that rejected latency-optimized inference, sent standard requests directly
+_LATENCY_UNSUPPORTED = set()
+
+
+@functools.lru_cache(maxsize=8)
+def _client(service: str, region: str):
+    """Return a boto3 client shared across tool calls (clients are thread-safe)."""
+    return boto3.client(service, region_name=region, config=_CLIENT_CONFIG)
+
 
 @tool
 def video_reader(
@@ -15,7 +62,8 @@ def video_reader(
     model_id: str = "us.amazon.nova-pro-v1:0",
     region: Optional[str] = None,
     s3_bucket: Optional[str] = None,
-    system_prompt: Optional[str] = None
+    system_prompt: Optional[str] = None,
+    latency_optimized: bool = False
 ) -> Dict[str, Any]:
     """
     Analyze video content using AWS Bedrock's multimodal capabilities.
@@ -43,12 +91,14 @@ def video_reader(
         region: AWS region for Bedrock client
         s3_bucket: S3 bucket name for uploading local videos
         system_prompt: Custom system prompt for analysis
+        latency_optimized: Use Bedrock latency-optimized inference, falling back to
+            standard inference for models or regions that don't support it
         
     Returns:
         Dictionary with video analysis results
     """
     # Validate Nova model limitations
-    if "identify" in text_prompt.lower() or "who is" in text_prompt.lower():
+    if _FORBIDDEN_PROMPT_RE.search(text_prompt):
         return {
             "status": "error",
             "content": [{"text": "❌ Nova models cannot identify or name people in videos"}]
@@ -62,9 +112,8 @@ def video_reader(
         if not system_prompt:
             system_prompt = "Always answer in the same language you are asked. Note: I can only analyze visual content, not audio."
         
-        # Initialize Bedrock client
-        session = boto3.Session(region_name=region)
-        bedrock_client = session.client('bedrock-runtime')
+        # Reuse the Bedrock client (and its connections) across calls
+        bedrock_client = _client('bedrock-runtime', region)
         
         # Determine video format
         video_format = _get_video_format(video_path)
@@ -82,7 +131,7 @@ def video_reader(
             if not s3_bucket:
                 s3_bucket = os.getenv('VIDEO_READER_S3_BUCKET', 'strands-agents-samples-bucket')
             
-            s3_uri = _upload_to_s3(video_path, s3_bucket, session)
+            s3_uri = _upload_to_s3(video_path, s3_bucket, region, video_format)
             if not s3_uri:
                 return {
                     "status": "error", 
@@ -110,11 +159,22 @@ def video_reader(
         }
         
         # Call Bedrock Converse API
-        response = bedrock_client.converse(
-            modelId=model_id,
-            messages=[message],
-            system=[{"text": system_prompt}]
-        )
+        converse_args = {
+            "modelId": model_id,
+            "messages": [message],
+            "system": [{"text": system_prompt}]
+        }
+        if latency_optimized and (region, model_id) not in _LATENCY_UNSUPPORTED:
+            try:
+                response = bedrock_client.converse(performanceConfig={'latency': 'optimized'}, **converse_args)
+            except ClientError as e:
+                if not _is_latency_unsupported(e):
+                    raise
+                # Latency-optimized inference isn't available for this model/region
+                _LATENCY_UNSUPPORTED.add((region, model_id))
+                response = bedrock_client.converse(**converse_args)
+        else:
+            response = bedrock_client.converse(**converse_args)
         
         # Extract response content
         text_response = response['output']['message']['content'][0]['text']
@@ -149,49 +209,105 @@ def video_reader(
         }
 
 
-def _get_video_format(file_path: str) -> Optional[str]:
-    """Get video format from file extension."""
-    formats = {
-        '.mp4': 'mp4', '.mov': 'mov', '.avi': 'avi', 
-        '.mkv': 'mkv', '.webm': 'webm'
-    }
+@tool
+async def video_reader_async(
+    video_path: str, 
+    text_prompt: str = "Describe what you see in this video",
+    model_id: str = "us.amazon.nova-pro-v1:0",
+    region: Optional[str] = None,
+    s3_bucket: Optional[str] = None,
+    system_prompt: Optional[str] = None,
+    latency_optimized: bool = False
+) -> Dict[str, Any]:
+    """
+    Analyze video content using AWS Bedrock, without blocking the event loop.
     
-    if file_path.startswith('s3://'):
-        filename = file_path.split('/')[-1]
-    else:
-        filename = os.path.basename(file_path)
+    Same arguments and results as video_reader, which runs in a worker thread
+    on the shared clients, so an async agent (or asyncio.gather) can analyze
+    several videos concurrently.
     
-    _, ext = os.path.splitext(filename.lower())
-    return formats.get(ext)
+    Args:
+        video_path: Path to video file (local path or S3 URI like s3://bucket/video.mp4)
+        text_prompt: Question or instruction for analyzing the video
+        model_id: Bedrock model ID to use for analysis
+        region: AWS region for Bedrock client
+        s3_bucket: S3 bucket name for uploading local videos
+        system_prompt: Custom system prompt for analysis
+        latency_optimized: Use Bedrock latency-optimized inference, falling back to
+            standard inference for models or regions that don't support it
+        
+    Returns:
+        Dictionary with video analysis results
+    """
+    return await asyncio.to_thread(
+        video_reader, video_path=video_path, text_prompt=text_prompt, model_id=model_id,
+        region=region, s3_bucket=s3_bucket, system_prompt=system_prompt,
+        latency_optimized=latency_optimized
+    )
+
+
+def _get_video_format(file_path: str) -> Optional[str]:
+    """Get video format from file extension (local path or S3 URI)."""
+    return _VIDEO_FORMATS.get(os.path.splitext(file_path)[1].lower())
 
 
-def _upload_to_s3(local_path: str, bucket: str, session: boto3.Session) -> Optional[str]:
-    """Upload video to S3 and return URI."""
+def _is_latency_unsupported(error: ClientError) -> bool:
+    """Whether a converse error rejects performanceConfig, rather than the request itself."""
+    if error.response['Error']['Code'] != 'ValidationException':
+        return False
+    message = error.response['Error'].get('Message', '').lower()
+    return 'performanceconfig' in message or 'latency' in message
+
+
+def _upload_to_s3(local_path: str, bucket: str, region: str, video_format: str) -> Optional[str]:
+    """
+    Upload video to S3 and return URI.
+    
+    Videos are stored under their content hash, so a video that is already in
+    the bucket costs one head_object instead of another upload.
+    """
     try:
-        s3_client = session.client('s3')
+        s3_client = _client('s3', region)
         
-        # Create bucket if needed
-        try:
-            s3_client.head_bucket(Bucket=bucket)
-        except ClientError:
+        # Create bucket if needed (checked once per process)
+        if (region, bucket) not in _VERIFIED_BUCKETS:
             try:
-                if session.region_name == 'us-east-1':
-                    s3_client.create_bucket(Bucket=bucket)
-                else:
-                    s3_client.create_bucket(
-                        Bucket=bucket,
-                        CreateBucketConfiguration={'LocationConstraint': session.region_name}
-                    )
+                s3_client.head_bucket(Bucket=bucket)
             except ClientError:
-                pass  # Bucket might already exist
+                try:
+                    if region == 'us-east-1':
+                        s3_client.create_bucket(Bucket=bucket)
+                    else:
+                        s3_client.create_bucket(
+                            Bucket=bucket,
+                            CreateBucketConfiguration={'LocationConstraint': region}
+                        )
+                except ClientError:
+                    pass  # Bucket might already exist
         
-        # Upload file
-        filename = os.path.basename(local_path)
-        s3_key = f"videos/{filename}"
-        s3_client.upload_file(local_path, bucket, s3_key)
+        s3_key = f"videos/{_file_digest(local_path)}.{video_format}"
+        try:
+            s3_client.head_object(Bucket=bucket, Key=s3_key)
+        except ClientError:
+            # Upload file
+            s3_client.upload_file(
+                local_path, bucket, s3_key,
+                Config=_TRANSFER_CONFIG,
+                ExtraArgs={'ContentType': _CONTENT_TYPES[video_format]}
+            )
+        _VERIFIED_BUCKETS.add((region, bucket))
         
         return f"s3://{bucket}/{s3_key}"
         
     except Exception as e:
         print(f"Upload error: {e}")
         return None
+
+
+def _file_digest(path: str) -> str:
+    """Hex BLAKE2b digest of a file's content, read in 1 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -5,11 +5,34 @@ This version processes videos locally by sending the video bytes directly to Bed
 eliminating the need for S3 bucket configuration and uploads.
 """
 import boto3
+import functools
+import mmap
 import os
+import re
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing import Dict, Any, Optional
 from strands import tool
 
+# Supported video formats (file extension == Converse API format)
+_VIDEO_FORMATS = frozenset({'mp4', 'mov', 'avi', 'mkv', 'webm'})
+
+# Requests Nova cannot fulfil (identifying people), matched case-insensitively in one pass
+_FORBIDDEN_PROMPT_RE = re.compile(r"identify|who is", re.IGNORECASE)
+
+# Keep connections open between calls and back off on throttling
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _bedrock_client(region: str):
+    """Return a Bedrock runtime client shared across tool calls (clients are thread-safe)."""
+    return boto3.client('bedrock-runtime', region_name=region, config=_CLIENT_CONFIG)
+
 
 @tool
 def video_reader_local(
@@ -64,7 +87,7 @@ def video_reader_local(
         >>> print(result['content'][0]['text'])
     """
     # Validate Nova model limitations
-    if "identify" in text_prompt.lower() or "who is" in text_prompt.lower():
+    if _FORBIDDEN_PROMPT_RE.search(text_prompt):
         return {
             "status": "error",
             "content": [{"text": "❌ Nova models cannot identify or name people in videos"}]
@@ -93,46 +116,45 @@ def video_reader_local(
                 "content": [{"text": "❌ Unsupported video format. Supported: mp4, mov, avi, mkv, webm"}]
             }
         
-        # Read video file and encode to base64
-        with open(video_path, 'rb') as video_file:
-            video_bytes = video_file.read()
-        
-        # Check file size (Bedrock has limits, typically ~20MB for videos)
-        file_size_mb = len(video_bytes) / (1024 * 1024)
+        # Check file size before reading anything (Bedrock has limits, typically ~20MB for videos)
+        file_size_mb = os.path.getsize(video_path) / (1024 * 1024)
         if file_size_mb > 20:
             return {
                 "status": "error",
                 "content": [{"text": f"❌ Video file too large ({file_size_mb:.1f}MB). Maximum size is ~20MB. Consider compressing the video."}]
             }
         
-        # Initialize Bedrock client
-        session = boto3.Session(region_name=region)
-        bedrock_client = session.client('bedrock-runtime')
+        # Map the video file read-only, botocore serializes straight from the page cache
+        # instead of from an extra in-memory bytes copy
+        with open(video_path, 'rb') as video_file, \
+                mmap.mmap(video_file.fileno(), 0, access=mmap.ACCESS_READ) as video_bytes:
+            # Reuse the Bedrock client (and its connections) across calls
+            bedrock_client = _bedrock_client(region)
         
-        # Prepare message for Converse API with inline video data
-        media_content = {
-            'video': {
-                "format": video_format,
-                "source": {
-                    'bytes': video_bytes
+            # Prepare message for Converse API with inline video data
+            media_content = {
+                'video': {
+                    "format": video_format,
+                    "source": {
+                        'bytes': video_bytes
+                    }
                 }
             }
-        }
         
-        message = {
-            "role": "user",
-            "content": [
-                {"text": text_prompt},
-                media_content
-            ]
-        }
+            message = {
+                "role": "user",
+                "content": [
+                    {"text": text_prompt},
+                    media_content
+                ]
+            }
         
-        # Call Bedrock Converse API
-        response = bedrock_client.converse(
-            modelId=model_id,
-            messages=[message],
-            system=[{"text": system_prompt}]
-        )
+            # Call Bedrock Converse API
+            response = bedrock_client.converse(
+                modelId=model_id,
+                messages=[message],
+                system=[{"text": system_prompt}]
+            )
         
         # Extract response content
         text_response = response['output']['message']['content'][0]['text']
@@ -170,14 +192,5 @@ def video_reader_local(
 
 def _get_video_format(file_path: str) -> Optional[str]:
     """Get video format from file extension."""
-    formats = {
-        '.mp4': 'mp4', 
-        '.mov': 'mov', 
-        '.avi': 'avi', 
-        '.mkv': 'mkv', 
-        '.webm': 'webm'
-    }
-    
-    filename = os.path.basename(file_path)
-    _, ext = os.path.splitext(filename.lower())
-    return formats.get(ext)
+    ext = file_path.rpartition('.')[2].lower()
+    return ext if ext in _VIDEO_FORMATS else None
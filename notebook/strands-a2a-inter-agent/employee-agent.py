@@ -1,6 +1,11 @@
+import hashlib
+import json
 import os
+import time
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import Tool as MCPTool
 from strands import Agent
+from strands.tools.mcp.mcp_agent_tool import MCPAgentTool
 from strands.tools.mcp.mcp_client import MCPClient
 from strands.multiagent.a2a import A2AServer
 from urllib.parse import urlparse
@@ -11,9 +16,43 @@ from strands.models.anthropic import AnthropicModel
 EMPLOYEE_INFO_URL = "http://localhost:8002/mcp/"
 EMPLOYEE_AGENT_URL = "http://localhost:8001/"
 
+# Tool definitions fetched from the MCP server are reused across restarts for a few minutes
+TOOLS_CACHE_TTL_SECONDS = 300
+TOOLS_CACHE_PATH = os.path.expanduser(
+    f"~/.cache/strands/tools_{hashlib.sha256(EMPLOYEE_INFO_URL.encode()).hexdigest()[:16]}.json"
+)
+
 # Create the MCP client
 employee_mcp_client = MCPClient(lambda: streamablehttp_client(EMPLOYEE_INFO_URL))
 
+
+def list_tools_cached(mcp_client, server_url):
+    # Use the cached tool definitions if they are recent and belong to this server
+    try:
+        if time.time() - os.path.getmtime(TOOLS_CACHE_PATH) < TOOLS_CACHE_TTL_SECONDS:
+            with open(TOOLS_CACHE_PATH) as f:
+                cached = json.load(f)
+            if cached["server_url"] == server_url:
+                return [MCPAgentTool(MCPTool.model_validate(tool), mcp_client) for tool in cached["tools"]]
+    except (OSError, ValueError, KeyError):
+        pass  # Missing or unreadable cache, fetch the tools again
+
+    tools = mcp_client.list_tools_sync()
+    try:
+        os.makedirs(os.path.dirname(TOOLS_CACHE_PATH), exist_ok=True)
+        # Write to a temporary file and rename it, so readers never see a partial file
+        temp_path = f"{TOOLS_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({
+                "server_url": server_url,
+                "tools": [tool.mcp_tool.model_dump(mode="json") for tool in tools]
+            }, f)
+        os.replace(temp_path, TOOLS_CACHE_PATH)
+    except OSError:
+        pass  # The cache is only an optimization
+    return tools
+
+
 model = AnthropicModel(
     client_args={
         "api_key": os.getenv("api_key"),  # Get API key from environment variables
@@ -28,7 +67,7 @@ model = AnthropicModel(
 
 # Using the MCP client within a context
 with employee_mcp_client:
-    tools = employee_mcp_client.list_tools_sync()
+    tools = list_tools_cached(employee_mcp_client, EMPLOYEE_INFO_URL)
     
     # Create a Strands agent
     employee_agent = Agent(